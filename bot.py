@@ -11,7 +11,7 @@ from cogs.music.manager import PlayerManager
 from cogs.music.music import Music
 from cogs.tts.tts import TTS
 from core.error_handler import ErrorHandler
-from utils import cleanup, get_env, setup_logger
+from utils import cleanup, get_env, setup_logger, stop_logging
 
 _log = logging.getLogger(name=__name__)
 
@@ -52,7 +52,7 @@ async def init_bot() -> None:
         token = get_env(key="TOKEN")
         if token is None:
             raise ValueError("Cannot find token in env.")
-        await bot.add_cog(Music(bot, PlayerManager(), ErrorHandler(bot)))
+        await bot.add_cog(Music(bot, PlayerManager(), bot.error_handler))
         await bot.add_cog(Greeting(bot))
         await bot.add_cog(TTS(bot))
         await bot.add_cog(Admin(bot))
@@ -63,12 +63,13 @@ def run_bot():
     try:
         asyncio.run(init_bot())
     except KeyboardInterrupt:
-        for vc in bot.voice_clients:
-            vc.disconnect()
+        # Voice clients are already disconnected by `bot.close()` when the
+        # `async with bot` block exits.
         print("Bot terminated by host.")
     except Exception:
         print(
             f"Bot terminated because of the following error:\n{traceback.format_exc()}"
         )
     finally:
+        stop_logging()
         cleanup()
@@ -11,9 +11,10 @@ class Admin(commands.Cog):
     @app_commands.command(name="shutdown", description="Shutdown the bot.")
     @commands.has_permissions(administrator=True)
     async def shutdown(self, interaction: discord.Interaction) -> None:
-        for player in PlayerManager().players.values():
+        players = PlayerManager().players
+        for player in players.values():
             player.destroy()
-            del player
+        players.clear()
 
         ctx = await self.bot.get_context(interaction)
         if ctx.voice_client:
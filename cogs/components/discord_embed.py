@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import List
 
 import discord
 from discord.ext import commands
@@ -53,11 +53,10 @@ class Embed:
         """playlist template"""
         self.embed.title = "In the playlist (10 songs next)"
         self.embed.color = discord.Color.green()
-        self.embed.description = ""
-        for song in playlist:
-            self.embed.description += (
-                f"{playlist.index(song)+1}. [{song.title}]({song.webpage_url})\n"
-            )
+        self.embed.description = "".join(
+            f"{position}. [{song.title}]({song.webpage_url})\n"
+            for position, song in enumerate(playlist, start=1)
+        )
         self.embed.set_footer(
             text=f"Requested by {self.ctx.author.name}",
             icon_url=self.ctx.author.avatar.url if self.ctx.author.avatar else None,
@@ -93,9 +92,9 @@ class Embed:
     def tts_lang(self, lang_dict: dict) -> discord.Embed:
         self.embed.title = "Language List"
         self.embed.color = discord.Color.green()
-        self.embed.description = ""
-        for lang in lang_dict:
-            self.embed.description += f"{lang}: {lang_dict[lang]}\n"
+        self.embed.description = "".join(
+            f"{lang}: {name}\n" for lang, name in lang_dict.items()
+        )
         return self.embed
 
     def game_free(self, game) -> discord.Embed:
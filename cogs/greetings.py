@@ -1,15 +1,35 @@
+import asyncio
+
+import aiohttp
 import discord
-import requests
 import speedtest
 from bs4 import BeautifulSoup
 from discord.ext import commands
 from discord import app_commands
 
+# (upper bound in milliseconds, embed color) for the ping command, checked in order.
+PING_COLORS = ((50, 0x44FF44), (100, 0xFFD000), (200, 0xFF6600))
+PING_COLOR_SLOW = 0x990000
+
 
 class Greeting(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self._last_member = None
+        self.session: aiohttp.ClientSession | None = None
+
+    async def cog_load(self) -> None:
+        # One session for the whole cog, so HTTP connections are kept alive and
+        # reused between commands instead of being set up on every request.
+        self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+
+    async def cog_unload(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+
+    async def _get_json(self, url: str):
+        async with self.session.get(url) as response:
+            return await response.json(content_type=None)
 
     @commands.command()
     async def hello(self, ctx, member: discord.Member | None = None, *args):
@@ -26,30 +46,16 @@ class Greeting(commands.Cog):
     async def ping(self, interaction):
         """Test connection of this bot."""
         ctx = await self.bot.get_context(interaction)
-        if round(self.bot.latency * 1000) <= 50:
-            embed = discord.Embed(
-                title="PING",
-                description=f":ping_pong: Pingpingpingpingping! The ping is **{round(self.bot.latency *1000)}** milliseconds!",
-                color=0x44FF44,
-            )
-        elif round(self.bot.latency * 1000) <= 100:
-            embed = discord.Embed(
-                title="PING",
-                description=f":ping_pong: Pingpingpingpingping! The ping is **{round(self.bot.latency *1000)}** milliseconds!",
-                color=0xFFD000,
-            )
-        elif round(self.bot.latency * 1000) <= 200:
-            embed = discord.Embed(
-                title="PING",
-                description=f":ping_pong: Pingpingpingpingping! The ping is **{round(self.bot.latency *1000)}** milliseconds!",
-                color=0xFF6600,
-            )
-        else:
-            embed = discord.Embed(
-                title="PING",
-                description=f":ping_pong: Pingpingpingpingping! The ping is **{round(self.bot.latency *1000)}** milliseconds!",
-                color=0x990000,
-            )
+        latency_ms = round(self.bot.latency * 1000)
+        color = next(
+            (color for limit, color in PING_COLORS if latency_ms <= limit),
+            PING_COLOR_SLOW,
+        )
+        embed = discord.Embed(
+            title="PING",
+            description=f":ping_pong: Pingpingpingpingping! The ping is **{latency_ms}** milliseconds!",
+            color=color,
+        )
         await ctx.send(embed=embed)
 
     @app_commands.command(name="sleep", description="Help your sleep better.")
@@ -60,41 +66,25 @@ class Greeting(commands.Cog):
         current_date_and_time = datetime.datetime.now()
         # add_hours = datetime.timedelta(hours = 7)
         # current_date_and_time = current_time + add_hours
-        format_time_now = str(current_date_and_time)
-        time_now = format_time_now[
-            format_time_now.find(" ") + 1: format_time_now.find(".") - 3
-        ]
+        time_now = current_date_and_time.strftime("%H:%M")
         hours = [4, 6, 7, 9]
         minutes = [44, 14, 44, 14]
         wakeup = []
         session_w = []
-        i = 0
-
-        def session():
-            if 0 <= format_time < 12:
-                session = "sáng"
-            elif 12 <= format_time < 18:
-                session = "chiều"
-            elif format_time >= 18:
-                session = "tối"
-            session_time = session
-            return session_time
+
+        def session(hour: int) -> str:
+            if hour < 12:
+                return "sáng"
+            elif hour < 18:
+                return "chiều"
+            return "tối"
 
         for i in range(4):
-            hours_added = datetime.timedelta(hours=hours[i])
-            minute_added = datetime.timedelta(minutes=minutes[i])
-            future_date_and_time = current_date_and_time + hours_added + minute_added
-            format_future_time = str(future_date_and_time)
-            future_time = format_future_time[
-                format_future_time.find(" ") + 1: format_future_time.find(".") - 3
-            ]
-            time = format_future_time[
-                format_future_time.find(" ") + 1: format_future_time.find(".") - 6
-            ]
-            format_time = int(time)
-            time_ses = session()
-            wakeup.append(future_time)
-            session_w.append(time_ses)
+            future_date_and_time = current_date_and_time + datetime.timedelta(
+                hours=hours[i], minutes=minutes[i]
+            )
+            wakeup.append(future_date_and_time.strftime("%H:%M"))
+            session_w.append(session(future_date_and_time.hour))
         await ctx.send(
             f"Bây giờ là {time_now}. Nếu bạn đi ngủ ngay bây giờ, bạn nên cố gắng thức dậy vào một trong những thời điểm sau: {wakeup[0]} {session_w[0]} hoặc {wakeup[1]} {session_w[1]} hoặc {wakeup[2]} {session_w[2]} hoặc {wakeup[3]} {session_w[3]}. \n\n(Thức dậy giữa một chu kỳ giấc ngủ khiến bạn cảm thấy mệt mỏi, nhưng khi thức dậy vào giữa chu kỳ tỉnh giấc sẽ làm bạn cảm thấy tỉnh táo và minh mẫn.)\n\nChúc ngủ ngon!😴"
         )
@@ -102,17 +92,16 @@ class Greeting(commands.Cog):
     @commands.command()
     async def currency(self, ctx, *args):
         msg = " ".join(args)
-        currency_from = msg.split(" ")[0]
-        currency_to = msg.split(" ")[1]
-        amount = msg.split(" ")[2]
+        currency_from, currency_to, amount = msg.split(" ")[:3]
         AmountFromAndTo = []
         NameCurrency = []
         InverseConversion = []
 
-        def get_data():
+        async def get_data():
             url = f"https://vn.exchange-rates.org/converter/{currency_from.upper()}/{currency_to.upper()}/{amount}/Y"
-            response = requests.get(url)
-            soup = BeautifulSoup(response.content, "html.parser")
+            async with self.session.get(url) as response:
+                content = await response.read()
+            soup = BeautifulSoup(content, "html.parser")
             for i in range(1, 3):
                 data = soup.findAll("div", class_=f"col-xs-6 result-cur{i}")
                 for information in data:
@@ -120,7 +109,7 @@ class Greeting(commands.Cog):
                     NameCurrency.append(information.find("dd").text)
                     InverseConversion.append(information.find("small").text)
 
-        get_data()
+        await get_data()
         nl = "\n"
         await ctx.send(
             f"{AmountFromAndTo[0]} {NameCurrency[0].replace(nl,'')} = {AmountFromAndTo[1]} {NameCurrency[1].replace(nl,'')}"
@@ -129,16 +118,18 @@ class Greeting(commands.Cog):
 
     @commands.command()
     async def speedtest(self, ctx):
-        s = speedtest.Speedtest(secure=True)
-        server = s.get_best_server()
+        # speedtest-cli is fully blocking (a test takes several seconds), so every
+        # step runs in a worker thread to keep the event loop responsive.
+        s = await asyncio.to_thread(speedtest.Speedtest, secure=True)
+        server = await asyncio.to_thread(s.get_best_server)
         await ctx.send(
             f"Host: {server['host']} in {server['name']}, {server['country']}"
         )
         await ctx.send("Download testing...")
-        download = round(s.download() / 1024 / 1024, 2)
+        download = round(await asyncio.to_thread(s.download) / 1024 / 1024, 2)
         await ctx.send(f"Download speed: {download} Mbps")
         await ctx.send("Upload testing...")
-        upload = round(s.upload() / 1024 / 1024, 2)
+        upload = round(await asyncio.to_thread(s.upload) / 1024 / 1024, 2)
         ping = "{:.0f}".format(float(s.results.ping))
         await ctx.send(f"Upload speed: {upload} Mbps")
         await ctx.send(
@@ -148,8 +139,8 @@ class Greeting(commands.Cog):
     @app_commands.command(name="dogimg", description="Get a random dog image.")
     async def dogimg(self, interaction: discord.Interaction):
         ctx = await self.bot.get_context(interaction)
-        img = requests.get("https://dog.ceo/api/breeds/image/random").json()
-        fact = requests.get("https://some-random-api.ml/facts/dog").json()
+        img = await self._get_json("https://dog.ceo/api/breeds/image/random")
+        fact = await self._get_json("https://some-random-api.ml/facts/dog")
         embed = discord.Embed(title="Dog", color=discord.Color.purple())  # Create embed
         embed.set_image(url=img["message"])
         embed.set_footer(text="Fact: " + fact["fact"])
@@ -158,8 +149,8 @@ class Greeting(commands.Cog):
     @app_commands.command(name="catimg", description="Get a random cat image.")
     async def catimg(self, interaction: discord.Interaction):
         ctx = await self.bot.get_context(interaction)
-        img = requests.get("https://some-random-api.ml/img/cat").json()
-        fact = requests.get("https://some-random-api.ml/facts/cat").json()
+        img = await self._get_json("https://some-random-api.ml/img/cat")
+        fact = await self._get_json("https://some-random-api.ml/facts/cat")
         embed = discord.Embed(title="Cat", color=discord.Color.purple())  # Create embed
         embed.set_image(url=img["link"])
         embed.set_footer(text="Fact: " + fact["fact"])
@@ -168,7 +159,7 @@ class Greeting(commands.Cog):
     @app_commands.command(name="meme", description="Get a random meme.")
     async def meme(self, interaction: discord.Interaction):
         ctx = await self.bot.get_context(interaction)
-        getMeme = requests.get("https://some-random-api.ml/meme").json()
+        getMeme = await self._get_json("https://some-random-api.ml/meme")
         image = getMeme["image"]
         caption = getMeme["caption"]
         embed = discord.Embed(
@@ -14,7 +14,7 @@ from cogs.components.discord_embed import Embed
 from cogs.music.core.playlist import PlaylistObserver
 from cogs.music.search import Search
 from discord.ext import commands
-from utils import Timer, convert_to_second, get_time
+from utils import Timer, convert_to_second, create_background_task
 
 _log = logging.getLogger(__name__)
 
@@ -73,7 +73,7 @@ class Audio:
                     await self.playlist_manager.playlist.get_next_prepared()
                 )
                 if song is None:
-                    self.current_song = None
+                    self.playlist_manager.current_song = None
                     if ctx is not None:
                         await ctx.send(embed=Embed().end_playlist())
                 else:
@@ -99,7 +99,9 @@ class Audio:
             self.is_playing = not self.is_playing
             self.playlist_manager.prev_song = self.playlist_manager.current_song
             self.playlist_manager.current_song = None
-            bot.loop.create_task(self.play_next(ctx))
+            # Usually runs on discord.py's audio player thread, so the task is
+            # created on the event loop thread instead of here.
+            bot.loop.call_soon_threadsafe(create_background_task, self.play_next(ctx))
 
     async def play(self, song: Song) -> None:
         """
@@ -110,7 +112,7 @@ class Audio:
             None
         """
         ctx = song.context
-        self.playlist_manager.current_song_start_time = convert_to_second(get_time())
+        self.playlist_manager.current_song_start_time = time.monotonic()
         self.playlist_manager.current_song_duration = convert_to_second(song.duration)
 
         self.timer.cancel()
@@ -136,8 +138,8 @@ class Audio:
         # assign this context for timeout_handler can work.
         self.ctx = ctx
 
-        start_time = time.time()
-        songs = await self._search_songs(query, priority)
+        start_time = time.perf_counter()
+        songs = await self._search_songs(query)
 
         if songs:
             await self.playlist_manager.add_songs(songs, priority)
@@ -206,16 +208,15 @@ class Audio:
     async def _search_songs(
         self,
         query: str,
-        priority: bool = False,
         provider: Optional[Literal["youtube", "soundcloud"]] = None,
         limit: int = 1,
     ) -> Optional[List[SongMeta]]:
-        return await Search().query(query, self.ctx, priority, provider, limit)
+        return await Search().query(query, self.ctx, provider, limit)
 
     def _log_song_addition(
         self, song_count: int, guild_id: int, query: str, start_time: float
     ) -> None:
-        end_time = time.time()
+        end_time = time.perf_counter()
         _log.info(
             f"Added {song_count} song(s) to guild '{guild_id}' playlist in {round(end_time-start_time,2)} seconds from query '{query}'."
         )
@@ -255,8 +256,10 @@ class Audio:
                 "Timer has been reset because discord.voice_client is still playing."
             )
         else:
-            playerManager = PlayerManager()
-            del playerManager.players[ctx.message.guild.id]
+            # The player may already be gone (e.g. released by /stop or a voice state
+            # update); the timer itself is this task, so it is not cancelled here.
+            PlayerManager().players.pop(ctx.message.guild.id, None)
+            self.playlist_manager.playlist.clear()
             await ctx.voice_client.disconnect()
             await ctx.send(
                 embed=Embed().leave_channel_message(
@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import logging
 from collections import deque
 from typing import Deque, List, Optional, TYPE_CHECKING
@@ -13,7 +14,7 @@ from cogs.music.core.song import (
 )
 from core.exceptions import MusicException
 from patterns.observe import Observable, Observer
-from utils import convert_to_second, convert_to_time
+from utils import convert_to_second, convert_to_time, create_background_task
 
 if TYPE_CHECKING:
     from cogs.music.controller import Audio
@@ -55,6 +56,27 @@ class PlayList(Observable):
             self._q.appendleft(song)
             await self.notify()
 
+    async def add_many(self, songs: List[SongMeta], to_front: bool = False) -> None:
+        """
+        Adds several songs to the playlist queue and notifies any waiting coroutines once.
+
+        Args:
+            songs (List[SongMeta]): The song metadata to be added to the queue.
+            to_front (bool, optional): If True, the songs are added to the front of the queue, keeping
+                                       their order, so `songs[0]` becomes the next song. Defaults to False.
+
+        Returns:
+            None
+        """
+        if not songs:
+            return
+        async with self.lock:
+            if to_front:
+                self._q.extendleft(reversed(songs))
+            else:
+                self._q.extend(songs)
+            await self.notify()
+
     def index(self, song: SongMeta) -> Optional[int]:
         """
         Get the index of a song in the queue.
@@ -97,7 +119,7 @@ class PlayList(Observable):
         """
         async with self.lock:
             try:
-                self._q.remove(self._q[index])
+                del self._q[index]
             except IndexError:
                 pass
 
@@ -153,12 +175,12 @@ class PlayList(Observable):
             str: The total duration in a human-readable format (HH:MM:SS).
         """
 
-        if to_song_index is None:
-            to_song_index = len(self._q)
-
-        sec = 0
-        for i in range(to_song_index):
-            sec += convert_to_second(time=self._q[i].duration)
+        # Iterate the deque directly: indexing a deque is O(n) towards the middle,
+        # which made the old `self._q[i]` loop quadratic for long queues.
+        sec = sum(
+            convert_to_second(time=song.duration)
+            for song in itertools.islice(self._q, to_song_index)
+        )
 
         return convert_to_time(seconds=sec)
 
@@ -173,9 +195,9 @@ class PlayList(Observable):
         """
 
         if limit is None:
-            return [song for song in self._q]
+            return list(self._q)
         else:
-            return [song for song in list(self._q)[:limit]]
+            return list(itertools.islice(self._q, limit))
 
     def get_next(self) -> SongMeta | None:
         """Get the next song meta and remove it from queue
@@ -254,12 +276,10 @@ class PlayList(Observable):
                 songs_need_to_update.append(None)
 
         songs_with_info = await get_songs_info(songs_need_to_update)
-        for song, song_with_info in zip(self._q, songs_with_info):
-            if song_with_info is not None:
-                song = song_with_info
-        _logger.debug(
-            f"Updated {len([i for i in songs_with_info if i is not None])} song(s) meta info."
-        )
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                f"Updated {sum(1 for i in songs_with_info if i is not None)} song(s) meta info."
+            )
 
     def trigger_update_all_song_meta(self) -> None:
         """
@@ -273,7 +293,7 @@ class PlayList(Observable):
             None
         """
         _logger.debug("Triggering update all song meta info.")
-        asyncio.create_task(self.__update_all_song_meta())
+        create_background_task(self.__update_all_song_meta())
 
 
 class PlaylistObserver(Observer):
@@ -204,7 +204,13 @@ async def _(song_meta: SpotifySongMeta) -> Union[Song, None]:
     _logger.info(f'Creating Spotify song: Searching for "{query}"')
 
     for vid in videos:
-        print(song.name, vid.title, song.duration_ms, vid.length * 1000)
+        _logger.debug(
+            "Spotify match candidate: %s | %s | %s ms | %s ms",
+            song.name,
+            vid.title,
+            song.duration_ms,
+            vid.length * 1000,
+        )
         if abs(song.duration_ms - vid.length * 1000) < (60 * 1000) or song.name in vid.title:
             video = vid
             break
@@ -251,27 +257,22 @@ async def get_songs_info(songs_need_to_update: List[SongMeta]) -> List[SongMeta]
         video = YouTube.from_id(song.video_id)
         song.update_meta(video)
 
-    # Get SoundCloud info
-    sc_service = SoundCloudService()
-    tracks = await sc_service.get_tracks_info([song.track_id for song in sc_songs])
-    for track in tracks:
-        song = next((s for s in sc_songs if s.track_id == track.id), None)
-        if song:
-            song.update_meta(track)
+    # Get SoundCloud info. Services are only created when there is something to
+    # fetch, so a queue without SoundCloud/Spotify songs never touches their APIs.
+    if sc_songs:
+        sc_service = SoundCloudService()
+        tracks = await sc_service.get_tracks_info([song.track_id for song in sc_songs])
+        tracks_by_id = {track.id: track for track in tracks}
+        for song in sc_songs:
+            track = tracks_by_id.get(song.track_id)
+            if track is not None:
+                song.update_meta(track)
 
     # Get Spotify info
-    sp_service = SpotifyService()
-    for song in sp_songs:
-        track = sp_service.get_track(song.track_id)
-        song.update_meta(track)
-
-    # Merge all songs back to the original list
-    for song in songs_need_to_update:
-        if isinstance(song, SoundCloudSongMeta):
-            song = next((s for s in sc_songs if s.track_id == song.track_id), song)
-        elif isinstance(song, YouTubeSongMeta):
-            song = next((s for s in yt_songs if s.video_id == song.video_id), song)
-        elif isinstance(song, SpotifySongMeta):
-            song = next((s for s in sp_songs if s.track_id == song.track_id), song)
+    if sp_songs:
+        sp_service = SpotifyService()
+        for song in sp_songs:
+            track = sp_service.get_track(song.track_id)
+            song.update_meta(track)
 
     return songs_need_to_update
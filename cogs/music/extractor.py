@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from abc import ABC, abstractmethod
 from typing import List, Literal, Union
@@ -20,11 +19,8 @@ _log = logging.getLogger(__name__)
 
 
 class Extractor(ABC):
-    def __init__(self) -> None:
-        self.loop = asyncio.get_event_loop()
-
     @abstractmethod
-    async def create_song_metadata(self, data, ctx, playlist_name) -> SongMeta:
+    def create_song_metadata(self, data, ctx, playlist_name) -> SongMeta:
         pass
 
     @abstractmethod
@@ -40,10 +36,7 @@ class Extractor(ABC):
 
 
 class YoutubeExtractor(Extractor):
-    def __init__(self) -> None:
-        super().__init__()
-
-    async def create_song_metadata(
+    def create_song_metadata(
         self, yt: YouTube, ctx: commands.Context, playlist_name: str | None
     ) -> YouTubeSongMeta:
         return YouTubeSongMeta(
@@ -62,23 +55,19 @@ class YoutubeExtractor(Extractor):
         if is_search:
             results = Search(query).videos
             if results:
-                songs = await asyncio.gather(
-                    *[
-                        self.create_song_metadata(result, ctx, None)
-                        for result in results[:limit]
-                    ]
-                )
+                songs = [
+                    self.create_song_metadata(result, ctx, None)
+                    for result in results[:limit]
+                ]
                 return songs
             return None
 
         if is_playlist:
             playlist = Playlist(query)
-            songs = await asyncio.gather(
-                *[
-                    self.create_song_metadata(video, ctx, playlist.title)
-                    for video in playlist.videos
-                ]
-            )
+            songs = [
+                self.create_song_metadata(video, ctx, playlist.title)
+                for video in playlist.videos
+            ]
             return songs
         else:
             try:
@@ -86,7 +75,7 @@ class YoutubeExtractor(Extractor):
             except VideoUnavailable:
                 return None
 
-            song = await self.create_song_metadata(yt, ctx, None)
+            song = self.create_song_metadata(yt, ctx, None)
             return [song]
 
 
@@ -95,7 +84,7 @@ class SoundCloudExtractor(Extractor):
         super().__init__()
         self.soundcloud = SoundCloudService()
 
-    async def create_song_metadata(
+    def create_song_metadata(
         self,
         track: Union[Track, BasicTrack, MiniTrack],
         ctx: commands.Context,
@@ -131,9 +120,7 @@ class SoundCloudExtractor(Extractor):
                     track = next(data)
                 tracks.append(track)
 
-            songs = await asyncio.gather(
-                *[self.create_song_metadata(track, ctx, None) for track in tracks]
-            )
+            songs = [self.create_song_metadata(track, ctx, None) for track in tracks]
 
             return songs
 
@@ -142,11 +129,11 @@ class SoundCloudExtractor(Extractor):
         if data is None:
             raise ExtractException("Failed to extract song from SoundCloud URL")
 
-        playlist_name = data["playlist_name"]
-        tracks = data["tracks"]
-        songs = await asyncio.gather(
-            *[self.create_song_metadata(track, ctx, playlist_name) for track in tracks]
-        )
+        playlist_name = data.playlist_name
+        tracks = data.tracks
+        songs = [
+            self.create_song_metadata(track, ctx, playlist_name) for track in tracks
+        ]
         _log.info(f"Extracted {len(songs)} song(s) from SoundCloud URL.")
         return songs
 
@@ -156,7 +143,7 @@ class SpotifyExtractor(Extractor):
         super().__init__()
         self.sp = SpotifyService()
 
-    async def create_song_metadata(
+    def create_song_metadata(
         self,
         data: Union[search.Track, playlist.Track, track.Track, album.Track],
         ctx,
@@ -182,30 +169,26 @@ class SpotifyExtractor(Extractor):
     ) -> List[SpotifySongMeta] | None:
         if is_search:
             data = self.sp.search(query, limit=limit)
-            songs = await asyncio.gather(
-                *[self.create_song_metadata(track, ctx, None) for track in data.items]
-            )
+            songs = [
+                self.create_song_metadata(track, ctx, None) for track in data.items
+            ]
             return songs
 
         data = await self.sp.resolve_url(query)
         if isinstance(data, playlist.Playlist):
             playlist_name = data.name
-            songs = await asyncio.gather(
-                *[
-                    self.create_song_metadata(track.track, ctx, playlist_name)
-                    for track in data.tracks.items
-                ]
-            )
+            songs = [
+                self.create_song_metadata(track.track, ctx, playlist_name)
+                for track in data.tracks.items
+            ]
         elif isinstance(data, album.Album):
             playlist_name = data.name
-            songs = await asyncio.gather(
-                *[
-                    self.create_song_metadata(track, ctx, playlist_name)
-                    for track in data.tracks.items
-                ]
-            )
+            songs = [
+                self.create_song_metadata(track, ctx, playlist_name)
+                for track in data.tracks.items
+            ]
         elif isinstance(data, track.Track):
-            songs = [await self.create_song_metadata(data, ctx, None)]
+            songs = [self.create_song_metadata(data, ctx, None)]
         return songs
 
 
@@ -215,12 +198,18 @@ class ExtractorFactory:
         "soundcloud": SoundCloudExtractor,
         "spotify": SpotifyExtractor,
     }
+    # Extractors hold no per-query state, so one instance per provider is reused.
+    _instances: dict[str, Extractor] = {}
 
     @classmethod
     def get_extractor(
         cls, extractor: Literal["youtube", "soundcloud", "spotify"]
     ) -> Extractor:
-        if extractor in cls.extractors:
-            return cls.extractors[extractor]()
-        else:
+        instance = cls._instances.get(extractor)
+        if instance is not None:
+            return instance
+        extractor_cls = cls.extractors.get(extractor)
+        if extractor_cls is None:
             raise ExtractException(f"Cannot find extractor with name '{extractor}'")
+        instance = cls._instances[extractor] = extractor_cls()
+        return instance
@@ -1,4 +1,4 @@
-import asyncio
+import time
 from typing import TYPE_CHECKING, List, Optional
 
 import discord
@@ -6,7 +6,7 @@ from cogs.components.discord_embed import Embed
 from cogs.music.core.playlist import PlayList
 from discord.ext import commands
 from patterns.singleton import SingletonMeta
-from utils import convert_to_second, convert_to_time, get_time
+from utils import convert_to_second, convert_to_time
 
 if TYPE_CHECKING:
     from cogs.music.controller import Audio
@@ -18,36 +18,38 @@ class PlaylistManager:
         self.playlist: PlayList = PlayList()
         self.current_song: Optional[Song] = None
         self.prev_song: Optional[Song] = None
+        # Monotonic clock reading (`time.monotonic()`) taken when the current song started.
         self.current_song_start_time: float = 0
         self.current_song_duration: float = 0
 
     async def add_songs(self, songs: List['SongMeta'], priority: bool = False) -> None:
-        add_method = self.playlist.add_next if priority else self.playlist.add
-        await asyncio.gather(*(add_method(song) for song in songs))
+        await self.playlist.add_many(songs, to_front=priority)
         self.playlist.trigger_update_all_song_meta()
 
-    def calculate_wait_time(self, latest_song: 'SongMeta', priority: bool) -> float:
-        current_time = convert_to_second(get_time())
+    def calculate_wait_time(self, song_index: int, priority: bool) -> float:
+        current_time = time.monotonic()
         time_wait = self.current_song_duration - (
             current_time - self.current_song_start_time
         )
         if not priority:
-            time_wait += convert_to_second(
-                self.playlist.time_wait(self.playlist.index(latest_song))
-            )
+            time_wait += convert_to_second(self.playlist.time_wait(song_index))
         return time_wait
 
     def get_song_added_embed(
         self, ctx: commands.Context, latest_song: 'SongMeta', priority: bool
     ) -> Optional[discord.Embed]:
-        if self.playlist.size() > 0 and self.playlist.index(latest_song) is not None:
-            time_wait = self.calculate_wait_time(latest_song, priority)
-            return Embed(ctx).add_song(
-                latest_song,
-                position=self.playlist.index(latest_song) + 1,
-                timewait=convert_to_time(time_wait),
-            )
-        return None
+        if self.playlist.size() == 0:
+            return None
+        # `index` is a linear scan of the queue, so look the song up only once.
+        song_index = self.playlist.index(latest_song)
+        if song_index is None:
+            return None
+        time_wait = self.calculate_wait_time(song_index, priority)
+        return Embed(ctx).add_song(
+            latest_song,
+            position=song_index + 1,
+            timewait=convert_to_time(time_wait),
+        )
 
 
 class PlayerManager(metaclass=SingletonMeta):
@@ -3,7 +3,7 @@ import functools
 
 import discord
 from cogs.components.discord_embed import Embed
-from cogs.music.controller import Audio, PlayerManager
+from cogs.music.controller import PlayerManager
 from cogs.music.view.view import MusicView
 from core.error_handler import ErrorHandler
 from discord import app_commands
@@ -64,6 +64,21 @@ class Music(commands.Cog):
             else:
                 await self.bot.on_command_error(ctx, commands.CommandError(str(error)))
 
+    @commands.Cog.listener()
+    async def on_voice_state_update(
+        self,
+        member: discord.Member,
+        before: discord.VoiceState,
+        after: discord.VoiceState,
+    ) -> None:
+        # Release the guild's player as soon as the bot leaves voice, however it
+        # happened (kicked, channel deleted, ...), instead of waiting for its timer.
+        if member.id != self.bot.user.id or after.channel is not None:
+            return
+        player = self.player_manager.players.pop(member.guild.id, None)
+        if player is not None:
+            player.destroy()
+
     @app_commands.command(
         name="search", description="Search for a song and play add it to the queue."
     )
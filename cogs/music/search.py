@@ -8,6 +8,8 @@ from discord.ext import commands
 
 _log = logging.getLogger(__name__)
 
+_YOUTUBE_HOSTS = frozenset(("www.youtube.com", "youtu.be"))
+
 
 class Search:
     "Methods: query"
@@ -17,7 +19,7 @@ class Search:
             # Attempt to parse the URL
             result = urllib.parse.urlparse(url_string)
             # Check if all parts are defined (excluding fragment)
-            return all([result.scheme, result.netloc, result.path])
+            return bool(result.scheme and result.netloc and result.path)
         except (ValueError, AttributeError):
             # If parsing fails, the string is not a URL
             return False
@@ -30,8 +32,7 @@ class Search:
 
     def is_youtube(self, url: str) -> bool:
         parsed_url = urllib.parse.urlparse(url)
-        netloc = parsed_url.netloc
-        return netloc.lower() == "www.youtube.com" or netloc.lower() == "youtu.be"
+        return parsed_url.netloc.lower() in _YOUTUBE_HOSTS
 
     def is_spotify(self, url: str) -> bool:
         parsed_url = urllib.parse.urlparse(url)
@@ -42,7 +43,6 @@ class Search:
         self,
         query: str,
         ctx: commands.Context,
-        priority: bool = False,
         provider: Optional[Literal["youtube", "soundcloud", "spotify"]] = None,
         limit: int = 1,
     ) -> Optional[List[SongMeta]]:
@@ -57,28 +57,18 @@ class Search:
         Args:
             query (str): The search string or URL to query.
             ctx (commands.Context): The context in which the command was invoked.
-            priority (bool, optional): If True, the order of the songs will be reversed. Defaults to False.
         Returns:
             List[SongMeta] | None: A list of SongMeta objects if songs are found, otherwise None.
         """
         songs = []
 
         if provider:
-            if provider == "youtube":
-                songs = await ExtractorFactory.get_extractor("youtube").get_data(
-                    query=query, ctx=ctx, is_search=not self.is_url(query), limit=limit
-                )
-            elif provider == "soundcloud":
-                songs = await ExtractorFactory.get_extractor("soundcloud").get_data(
-                    query=query, ctx=ctx, is_search=not self.is_url(query), limit=limit
-                )
-            elif provider == "spotify":
-                songs = await ExtractorFactory.get_extractor("spotify").get_data(
-                    query=query, ctx=ctx, is_search=not self.is_url(query), limit=limit
-                )
-            else:
+            if provider not in ExtractorFactory.extractors:
                 _log.error(f"Invalid provider '{provider}'")
                 return ValueError(f"Invalid provider '{provider}'")
+            songs = await ExtractorFactory.get_extractor(provider).get_data(
+                query=query, ctx=ctx, is_search=not self.is_url(query), limit=limit
+            )
         else:
             if self.is_url(query):
                 if self.is_youtube(query):
@@ -107,8 +97,6 @@ class Search:
                     )
 
         if songs:
-            if priority:
-                songs.reverse()
             return [song for song in songs if song is not None]
         else:
             _log.error(f"No results were found for the query '{query}'")
@@ -1,9 +1,12 @@
 import asyncio
 import logging
-from typing import List, Union
+from dataclasses import dataclass
+from typing import List, Optional, Union
 
 import requests
-from soundcloud import AlbumPlaylist, BasicTrack, SoundCloud, Track
+from requests.adapters import HTTPAdapter
+from soundcloud import AlbumPlaylist, BasicTrack, MiniTrack, SoundCloud, Track
+from urllib3.util.retry import Retry
 
 from core.exceptions import ResolveException
 from patterns.singleton import SingletonMeta
@@ -12,20 +15,44 @@ from utils import to_thread
 _log = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ExtractedTracks:
+    """Tracks resolved from a SoundCloud URL, with the playlist name if the URL was a playlist."""
+
+    playlist_name: Optional[str]
+    tracks: List[Union[Track, BasicTrack, MiniTrack]]
+
+
 class SoundCloudService(metaclass=SingletonMeta):
     def __init__(self) -> None:
         self.sc = SoundCloud()
         self.client_id = self.sc.client_id
 
+        # Keep-alive session for stream lookups. Transient failures (rate limits and
+        # 5xx responses) are retried with exponential backoff instead of failing the song.
+        # `Retry-After` is ignored so a throttling server cannot stall song start beyond
+        # the backoff below (about 3 seconds of sleeping over all retries).
+        # This Session is shared by the `to_thread` workers of `get_playback_url`, which
+        # can run concurrently; it is only used for plain GETs, with no per-request
+        # state set on the Session itself.
+        self.http = requests.Session()
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=False,
+        )
+        self.http.mount("https://", HTTPAdapter(max_retries=retry))
+
     @to_thread
     def search(self, query: str):
-        _log.debug(f"Searching for: '{query}'")
+        _log.debug("Searching for: '%s'", query)
         return self.sc.search(query)
 
     @to_thread
     def resolve_url(self, url: str):
         r = self.sc.resolve(url)
-        _log.debug(f"Resolved URL: '{url}'. Type: {type(r)}")
+        _log.debug("Resolved URL: '%s'. Type: %s", url, type(r))
         return r
 
     def get_thumbnail(self, track: Union[Track, BasicTrack]) -> str:
@@ -41,11 +68,11 @@ class SoundCloudService(metaclass=SingletonMeta):
             "client_id": self.client_id,
             "track_authorization": track_authorization,
         }
-        response = requests.get(
-            stream_url, headers=self.sc._get_default_headers(), params=params
+        response = self.http.get(
+            stream_url, headers=self.sc._get_default_headers(), params=params, timeout=10
         )
         response.raise_for_status()
-        _log.debug(f"Got playback URL for: '{track.title}'")
+        _log.debug("Got playback URL for: '%s'", track.title)
         return response.json()["url"]
 
     @to_thread
@@ -66,7 +93,7 @@ class SoundCloudService(metaclass=SingletonMeta):
             tracks.extend(res)
         return tracks
 
-    async def extract_song_from_url(self, url: str):
+    async def extract_song_from_url(self, url: str) -> Optional[ExtractedTracks]:
         resolve = await self.resolve_url(url)
         if resolve is None or not isinstance(resolve, (AlbumPlaylist, Track)):
             if resolve is None:
@@ -79,16 +106,8 @@ class SoundCloudService(metaclass=SingletonMeta):
                 raise ResolveException(error)
 
         if isinstance(resolve, AlbumPlaylist):
-            return {
-                "playlist_id": resolve.id,
-                "playlist_name": resolve.title,
-                "tracks": resolve.tracks,
-            }
+            return ExtractedTracks(playlist_name=resolve.title, tracks=resolve.tracks)
         elif isinstance(resolve, Track):
-            return {
-                "playlist_id": None,
-                "playlist_name": None,
-                "tracks": [resolve],
-            }
+            return ExtractedTracks(playlist_name=None, tracks=[resolve])
         else:
             return None
@@ -3,12 +3,12 @@ from typing import List, Optional, Dict
 from mapper.jsonmapper import JsonObject
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalUrls(JsonObject):
     spotify: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Artist(JsonObject):
     external_urls: ExternalUrls
     href: str
@@ -18,20 +18,20 @@ class Artist(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(JsonObject):
     url: str
     height: int
     width: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Copyright(JsonObject):
     text: str
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Track(JsonObject):
     artists: List[Artist]
     disc_number: int
@@ -49,7 +49,7 @@ class Track(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Tracks(JsonObject):
     href: str
     limit: int
@@ -60,7 +60,7 @@ class Tracks(JsonObject):
     items: List[Track]
 
 
-@dataclass
+@dataclass(slots=True)
 class Album(JsonObject):
     album_type: str
     total_tracks: int
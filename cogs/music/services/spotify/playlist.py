@@ -3,19 +3,19 @@ from typing import List, Optional, Dict, Any
 from mapper.jsonmapper import JsonObject
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalUrls(JsonObject):
     spotify: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(JsonObject):
     height: Optional[int]
     url: str
     width: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Owner(JsonObject):
     display_name: str
     external_urls: ExternalUrls
@@ -25,7 +25,7 @@ class Owner(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Artist(JsonObject):
     external_urls: ExternalUrls
     href: str
@@ -35,7 +35,7 @@ class Artist(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Album(JsonObject):
     album_type: str
     artists: List[Artist]
@@ -52,7 +52,7 @@ class Album(JsonObject):
     is_playable: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Track(JsonObject):
     album: Album
     artists: List[Artist]
@@ -75,7 +75,7 @@ class Track(JsonObject):
     episode: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackItem(JsonObject):
     added_at: str
     added_by: Dict[str, str]
@@ -85,7 +85,7 @@ class TrackItem(JsonObject):
     video_thumbnail: Dict[str, Optional[str]]
 
 
-@dataclass
+@dataclass(slots=True)
 class Tracks(JsonObject):
     href: str
     items: List[TrackItem]
@@ -96,7 +96,7 @@ class Tracks(JsonObject):
     total: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Playlist(JsonObject):
     collaborative: bool
     description: str
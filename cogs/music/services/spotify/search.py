@@ -1,14 +1,14 @@
 from dataclasses import dataclass
-from typing import List, Dict, Optional
+from typing import List, Optional
 from mapper.jsonmapper import JsonObject
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalUrls(JsonObject):
     spotify: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Artist(JsonObject):
     external_urls: ExternalUrls
     href: str
@@ -18,14 +18,14 @@ class Artist(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(JsonObject):
     url: str
     width: int
     height: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Album(JsonObject):
     album_type: str
     artists: List[Artist]
@@ -42,7 +42,7 @@ class Album(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Track(JsonObject):
     artists: List[Artist]
     disc_number: int
@@ -60,7 +60,7 @@ class Track(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Tracks(JsonObject):
     href: str
     limit: int
@@ -1,3 +1,4 @@
+import functools
 import urllib.parse
 
 import spotipy
@@ -46,6 +47,10 @@ class SpotifyService(metaclass=SingletonMeta):
         else:
             raise ValueError(f"Invalid Spotify URL: {url}")
 
+    # Track metadata does not change, so playing the same track again reuses the
+    # earlier lookup instead of another Web API request. The cache holds a reference
+    # to `self`, which is fine because this service is a singleton.
+    @functools.lru_cache(maxsize=256)
     def get_track(self, track_id: str) -> Track:
         track = self.sp.track(track_id, market=self.market)
         return load_track(track)  # type: ignore
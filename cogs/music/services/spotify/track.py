@@ -3,12 +3,12 @@ from typing import List, Dict
 from mapper.jsonmapper import JsonObject
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalUrls(JsonObject):
     spotify: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Artist(JsonObject):
     external_urls: ExternalUrls
     href: str
@@ -18,14 +18,14 @@ class Artist(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Image(JsonObject):
     url: str
     width: int
     height: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Album(JsonObject):
     album_type: str
     artists: List[Artist]
@@ -42,7 +42,7 @@ class Album(JsonObject):
     uri: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Track(JsonObject):
     album: Album
     artists: List[Artist]
@@ -1,6 +1,6 @@
 import asyncio
+import io
 import logging
-import os
 import gtts
 from gtts import gTTS
 import discord
@@ -13,20 +13,22 @@ _log = logging.getLogger(__name__)
 class TTS(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.temp_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), TEMP_FOLDER)
-        self.full_path = os.path.join(self.temp_path, TEMP_FILENAME)
-        
-        # Ensure temp folder exists
-        os.makedirs(self.temp_path, exist_ok=True)
+
+    @staticmethod
+    def _synthesize(text: str, lang: str) -> io.BytesIO:
+        """Render the speech into an in-memory MP3 buffer, ready to be piped to FFmpeg."""
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=lang).write_to_fp(buffer)
+        buffer.seek(0)
+        return buffer
 
     async def tts(self, ctx: commands.Context, text: str, lang: str = DEFAULT_LANG) -> None:
         loop = asyncio.get_event_loop()
         try:
-            tts = await loop.run_in_executor(None, lambda: gTTS(text=text, lang=lang))
-            await loop.run_in_executor(None, tts.save, self.full_path)
-            _log.info(f"'voice.mp3' file has been saved at {self.temp_path}.")
-            
-            source = discord.FFmpegPCMAudio(self.full_path)
+            buffer = await loop.run_in_executor(None, self._synthesize, text, lang)
+            _log.info(f"TTS audio has been synthesized ({buffer.getbuffer().nbytes} bytes).")
+
+            source = discord.FFmpegPCMAudio(buffer, pipe=True)
             ctx.voice_client.play(source)
         except Exception as e:
             _log.error(f"Error in TTS: {e}")
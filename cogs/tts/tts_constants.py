@@ -5,8 +5,4 @@ MAX_TTS_CHARS = 300
 TRUNCATED_CHARS = 80
 
 # Default language for TTS
-DEFAULT_LANG = "vi"
-
-# Path for temporary audio files
-TEMP_FOLDER = "temp_folder"
-TEMP_FILENAME = "voice.mp3"
\ No newline at end of file
+DEFAULT_LANG = "vi"
\ No newline at end of file
@@ -2,7 +2,6 @@ import os
 
 # declare some constants
 CUR_PATH = os.path.dirname(os.path.realpath(__file__))
-TEMP_FOLDER = CUR_PATH + r"/temp_folder"
 
 VOICE_TIMEOUT = 10 * 60
 RENEW_TIME = 6 * 60 * 60
@@ -1,16 +1,35 @@
 import discord
 from discord.ext import commands
 import traceback
-from typing import Optional
-import datetime
+from typing import Callable, Optional, Union
 import logging
-import logging.handlers
-from pathlib import Path
 
 
 class ErrorHandler:
     """A class to handle errors globally across the bot"""
 
+    # User-friendly error messages, checked in order. Callables build the message
+    # from the error itself, so error-specific attributes are only read when the
+    # error type actually matches.
+    USER_FRIENDLY_ERRORS: dict[
+        type[Exception], Union[str, Callable[[Exception], str], None]
+    ] = {
+        commands.MissingPermissions: "You don't have the required permissions to use this command.",
+        commands.BotMissingPermissions: "I don't have the required permissions to execute this command.",
+        commands.MissingRequiredArgument: lambda error: f"Missing required argument: {error.param.name}",
+        commands.BadArgument: "Invalid argument provided.",
+        commands.CommandOnCooldown: lambda error: f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
+        commands.NoPrivateMessage: "This command cannot be used in private messages.",
+        commands.DisabledCommand: "This command is currently disabled.",
+        commands.MemberNotFound: "Could not find the specified member.",
+        commands.ChannelNotFound: "Could not find the specified channel.",
+        commands.RoleNotFound: "Could not find the specified role.",
+        commands.TooManyArguments: "Too many arguments provided.",
+        commands.UserInputError: "Invalid input provided.",
+        commands.CommandNotFound: None,  # We don't want to respond to unknown commands
+    }
+    HANDLED_ERROR_TYPES: tuple[type[Exception], ...] = tuple(USER_FRIENDLY_ERRORS)
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.error_channel_id: Optional[int] = None
@@ -49,7 +68,7 @@ class ErrorHandler:
         embed = discord.Embed(
             title="❌ Error Occurred",
             color=discord.Color.red(),
-            timestamp=datetime.datetime.utcnow(),
+            timestamp=discord.utils.utcnow(),
         )
 
         # Get command information
@@ -89,6 +108,22 @@ class ErrorHandler:
 
         return embed
 
+    async def _report_to_error_channel(
+        self,
+        error: Exception,
+        ctx: Optional[commands.Context] = None,
+        interaction: Optional[discord.Interaction] = None,
+    ) -> None:
+        """Sends the detailed error embed to the error channel, if one is configured"""
+        if not self.error_channel_id:
+            return
+        error_channel = self.bot.get_channel(self.error_channel_id)
+        if error_channel:
+            error_embed = await self.create_error_embed(
+                error, ctx=ctx, interaction=interaction
+            )
+            await error_channel.send(embed=error_embed)
+
     async def handle_command_error(
         self, ctx: commands.Context, error: Exception
     ) -> None:
@@ -97,23 +132,6 @@ class ErrorHandler:
         # Get original error if exists
         error = getattr(error, "original", error)
 
-        # User-friendly error messages
-        user_friendly_errors = {
-            commands.MissingPermissions: "You don't have the required permissions to use this command.",
-            commands.BotMissingPermissions: "I don't have the required permissions to execute this command.",
-            commands.MissingRequiredArgument: f"Missing required argument: {error.param.name}",
-            commands.BadArgument: "Invalid argument provided.",
-            commands.CommandOnCooldown: f"This command is on cooldown. Try again in {error.retry_after:.2f} seconds.",
-            commands.NoPrivateMessage: "This command cannot be used in private messages.",
-            commands.DisabledCommand: "This command is currently disabled.",
-            commands.MemberNotFound: "Could not find the specified member.",
-            commands.ChannelNotFound: "Could not find the specified channel.",
-            commands.RoleNotFound: "Could not find the specified role.",
-            commands.TooManyArguments: "Too many arguments provided.",
-            commands.UserInputError: "Invalid input provided.",
-            commands.CommandNotFound: None,  # We don't want to respond to unknown commands
-        }
-
         # Log error with context
         self.log_error(
             error,
@@ -127,9 +145,9 @@ class ErrorHandler:
 
         # Get user-friendly error message
         error_message = None
-        for error_type, message in user_friendly_errors.items():
+        for error_type, message in self.USER_FRIENDLY_ERRORS.items():
             if isinstance(error, error_type):
-                error_message = message
+                error_message = message(error) if callable(message) else message
                 break
 
         if error_message:
@@ -140,12 +158,8 @@ class ErrorHandler:
             await ctx.send(embed=error_embed, delete_after=10)
 
         # Send to error channel if it's an unexpected error
-        if not any(isinstance(error, err_type) for err_type in user_friendly_errors):
-            error_embed = await self.create_error_embed(error, ctx=ctx)
-            if self.error_channel_id:
-                error_channel = self.bot.get_channel(self.error_channel_id)
-                if error_channel:
-                    await error_channel.send(embed=error_embed)
+        if not isinstance(error, self.HANDLED_ERROR_TYPES):
+            await self._report_to_error_channel(error, ctx=ctx)
 
     async def handle_interaction_error(
         self, interaction: discord.Interaction, error: Exception
@@ -175,32 +189,17 @@ class ErrorHandler:
             error_message = str(error.original)
 
         # Send error message to user
+        error_embed = discord.Embed(
+            title="❌ Error", description=error_message, color=discord.Color.red()
+        )
         try:
             if interaction.response.is_done():
-                await interaction.followup.send(
-                    embed=discord.Embed(
-                        title="❌ Error",
-                        description=error_message,
-                        color=discord.Color.red(),
-                    ),
-                    ephemeral=True,
-                )
+                await interaction.followup.send(embed=error_embed, ephemeral=True)
             else:
-                await interaction.response.send_message(
-                    embed=discord.Embed(
-                        title="❌ Error",
-                        description=error_message,
-                        color=discord.Color.red(),
-                    ),
-                    ephemeral=True,
-                )
+                await interaction.response.send_message(embed=error_embed, ephemeral=True)
         except discord.errors.InteractionResponded:
             pass
 
         # Log unexpected errors to error channel
         if not isinstance(error, discord.app_commands.CommandInvokeError):
-            error_embed = await self.create_error_embed(error, interaction=interaction)
-            if self.error_channel_id:
-                error_channel = self.bot.get_channel(self.error_channel_id)
-                if error_channel:
-                    await error_channel.send(embed=error_embed)
+            await self._report_to_error_channel(error, interaction=interaction)
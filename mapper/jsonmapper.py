@@ -1,9 +1,9 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from typing import Any, Union
 
 
 # Base class for JSON serialization
-@dataclass
+@dataclass(slots=True)
 class JsonObject:
     def to_dict(self) -> dict:
         def _convert(obj):
@@ -16,7 +16,9 @@ class JsonObject:
             else:
                 return obj
 
-        return {k: _convert(v) for k, v in asdict(self).items()}
+        # Walk the fields directly; `asdict` would deep-copy the whole tree first
+        # and then `_convert` would walk it a second time.
+        return {f.name: _convert(getattr(self, f.name)) for f in fields(self)}
 
     @classmethod
     def from_dict(cls, data: dict) -> "JsonObject":
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List
 
@@ -53,11 +54,10 @@ class Observable:
         """
         Asynchronously notifies all observers by calling their update method.
 
-        This method iterates over the list of observers and calls the update method
-        on each observer, passing the current instance as an argument.
+        The update method of every observer is awaited concurrently, passing the
+        current instance as an argument, so one slow observer does not hold up the others.
 
         Returns:
             None
         """
-        for observe in self._observers:
-            await observe.update(self)
+        await asyncio.gather(*(observe.update(self) for observe in self._observers))
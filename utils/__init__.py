@@ -3,8 +3,9 @@ import functools
 import logging
 import logging.handlers
 import os
+import queue
+import re
 from datetime import datetime, timedelta
-import sys
 import shutil
 from pathlib import Path
 from typing import Any, Callable, Coroutine, Literal, Union
@@ -13,6 +14,10 @@ from dotenv import find_dotenv, load_dotenv
 
 import constants
 
+# Matches the output of `str(timedelta)` for durations of a day or more,
+# e.g. '1 day, 3:04:05'.
+_DURATION_PATTERN = re.compile(r"(\d+) days?, (\d{1,2}):(\d{1,2}):(\d{1,2})", re.ASCII)
+
 
 def to_thread(func: Callable) -> Coroutine:
     @functools.wraps(func)
@@ -22,11 +27,48 @@ def to_thread(func: Callable) -> Coroutine:
     return wrapper  # type: ignore
 
 
+# The event loop only keeps weak references to tasks, so fire-and-forget tasks are
+# held here until they finish.
+_background_tasks: "set[asyncio.Task]" = set()
+
+
+def create_background_task(coro: Coroutine) -> asyncio.Task:
+    """Schedule a coroutine on the running loop and keep a reference until it ends.
+    Must be called from the event loop thread."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _time_format_error(time: str) -> ValueError:
+    return ValueError(f"time data '{time}' does not match format '%H:%M:%S'")
+
+
+def _clock_to_seconds(time: str, hours: str, minutes: str, seconds: str) -> int:
+    """Checks the fields the way `strptime(time, '%H:%M:%S')` does and sums them."""
+    h, m, s = int(hours), int(minutes), int(seconds)
+    if h > 23 or m > 59 or s > 59:
+        raise _time_format_error(time)
+    return h * 3600 + m * 60 + s
+
+
 def convert_to_second(time: str) -> float:
     """Converts a time string with '%H:%M:%S' format to seconds."""
-    parsed_datetime: datetime = datetime.strptime(time, "%H:%M:%S")
-    dt: timedelta = parsed_datetime - datetime(1900, 1, 1)
-    return dt.total_seconds()
+    if "day" not in time:
+        fields = time.split(":")
+        if len(fields) != 3 or not all(
+            1 <= len(field) <= 2 and field.isascii() and field.isdigit()
+            for field in fields
+        ):
+            raise _time_format_error(time)
+        return float(_clock_to_seconds(time, *fields))
+
+    match = _DURATION_PATTERN.fullmatch(time)
+    if match is None:
+        raise _time_format_error(time)
+    days, hours, minutes, seconds = match.groups()
+    return float(int(days) * 86400 + _clock_to_seconds(time, hours, minutes, seconds))
 
 
 def convert_to_time(seconds: float) -> str:
@@ -77,21 +119,36 @@ def format_duration(
     return str(duration_fmt)
 
 
+@functools.cache
+def _load_dotenv() -> None:
+    """Load the `.env` file into the process environment. Runs only once."""
+    load_dotenv(dotenv_path=find_dotenv())
+
+
 def get_env(key: str) -> Union[str, None]:
     """Get the environment variable by the key."""
-    load_dotenv(dotenv_path=find_dotenv())
+    _load_dotenv()
     TOKEN: str | None = os.environ.get(key)
     return TOKEN
 
 
-def setup_logger(name: str, level=logging.DEBUG):
-    """Set up logging configuration"""
-    # Create logs directory if it doesn't exist
-    Path(f"{constants.CUR_PATH}/logs").mkdir(exist_ok=True)
+# All named loggers share one queue. Log calls only enqueue the record; the
+# listener thread owns the file handlers, so disk writes and log rollovers never
+# run on the event loop.
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_log_listener: logging.handlers.QueueListener | None = None
 
-    # Create logger
-    logger = logging.getLogger(name)
-    logger.setLevel(level)
+
+def _start_log_listener() -> None:
+    """Create the log file handlers once and start the background listener."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    # Create logs directory if it doesn't exist
+    logs_dir = Path(f"{constants.CUR_PATH}/logs")
+    logs_dir.mkdir(exist_ok=True)
 
     # Create formatters
     dt_fmt = "%Y-%m-%d %H:%M:%S"
@@ -101,24 +158,22 @@ def setup_logger(name: str, level=logging.DEBUG):
 
     # File handler for all logs
     file_handler = logging.handlers.RotatingFileHandler(
-        filename="logs/bot.log",
+        filename=logs_dir / "bot.log",
         encoding="utf-8",
         maxBytes=32 * 1024 * 1024,  # 32 MiB
         backupCount=5,
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # File handler for errors only
     error_handler = logging.handlers.RotatingFileHandler(
-        filename="logs/error.log",
+        filename=logs_dir / "error.log",
         encoding="utf-8",
         maxBytes=32 * 1024 * 1024,  # 32 MiB
         backupCount=5,
     )
     error_handler.setFormatter(formatter)
     error_handler.setLevel(logging.ERROR)
-    logger.addHandler(error_handler)
 
     # Optional console handler
     # console_handler = logging.StreamHandler()
@@ -126,22 +181,46 @@ def setup_logger(name: str, level=logging.DEBUG):
     # console_handler.setLevel(
     #     logging.WARNING
     # )  # Only show warnings and errors in console
-    # logger.addHandler(console_handler)
+
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue, file_handler, error_handler, respect_handler_level=True
+    )
+    _log_listener.start()
+
+
+def setup_logger(name: str, level=logging.DEBUG):
+    """Set up logging configuration"""
+    _start_log_listener()
+
+    # Create logger
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    if _queue_handler not in logger.handlers:
+        logger.addHandler(_queue_handler)
+
+
+def stop_logging() -> None:
+    """Flush pending log records and stop the background listener."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 def cleanup() -> None:
     """Clean garbages after bot end."""
-    import shutil
-
-    def remove_dirs(curr_dir="./", del_dirs=["temp_folder", "__pycache__"]):
-        for del_dir in del_dirs:
-            if del_dir in os.listdir(curr_dir):
-                shutil.rmtree(os.path.join(curr_dir, del_dir))
 
-        for dir in os.listdir(curr_dir):
-            dir = os.path.join(curr_dir, dir)
-            if os.path.isdir(dir):
-                remove_dirs(dir, del_dirs)
+    def remove_dirs(curr_dir="./", del_dirs=("temp_folder", "__pycache__")):
+        # One scandir per directory: the entry type comes from the directory
+        # listing itself, so no extra stat call is needed per entry.
+        with os.scandir(curr_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                if entry.name in del_dirs:
+                    shutil.rmtree(entry.path)
+                else:
+                    remove_dirs(entry.path, del_dirs)
 
     try:
         remove_dirs(curr_dir=constants.CUR_PATH)